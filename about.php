@@ -1,5 +1,9 @@
 <?php
     $title = "ImgURL - 简单、纯粹的图床程序。";
+    //本页不查询数据库，跳过连接初始化
+    define('IMGURL_NODB',true);
+    //载入配置文件，说明文字里的限额直接取配置
+    include_once("./config.php");
     include_once("./tpl/user/header.php");
 ?>
 
@@ -19,7 +23,7 @@
 			<h3>使用说明</h3>
             <ul>
                 <li>图片最大上传限制为2M</li>
-                <li>游客每天限制上传5张图片</li>
+                <li>游客每天限制上传<?php echo $config['limit']; ?>张图片</li>
                 <li>图片定期清理，重要图片建议自行下载ImgURL部署</li>
                 <li>勿上传暴力、色情、反动图片，否则后果自负</li>
                 <li>如果您使用ImgURL代表同意以上协议</li>
@@ -1,8 +1,13 @@
 <?php
+    //本页只读取版本号，跳过数据库初始化
+    define('IMGURL_NODB',true);
     include_once("../config.php");
 
-    $year = date('Y',time());
 
-    $version = file_get_contents(APP."functions/version.txt");
-    echo "当前版本：".$version."<br />";
+    //版本号文件缺失时给出占位，不影响页面显示
+    $version = @file_get_contents(APP."functions/version.txt");
+    if($version === false) {
+        $version = '未知';
+    }
+    echo "当前版本：".trim($version)."<br />";
 ?>
\ No newline at end of file
@@ -1,9 +1,7 @@
 <?php
-    error_reporting(E_ALL^E_NOTICE^E_WARNING^E_DEPRECATED);
     include_once("../functions/class/class.admin.php");
-    //获取图片ID
+    //获取图片ID，图片删除支持逗号分隔的多个ID
     $id = $_GET['id'];
-    $id = (int) $id;
     //获取类型
     $type = $_GET['type'];
 
@@ -15,7 +13,7 @@
     // 判断类型
     switch ($type) {
         case 'sm':
-            $pic->deletesm($id);
+            $pic->deletesm((int)$id);
             break;
         
         default:
@@ -1,8 +1,12 @@
 <?php
     $title = "登录 - ImgURL";
-    // 简单的判断用户是否登录
-    if(isset($_COOKIE['user'])) {
+    //本页只校验cookie，跳过数据库初始化
+    define('IMGURL_NODB',true);
+    include_once("../config.php");
+    //凭证和配置一致才跳转，过期或伪造的cookie继续停留在登录页，避免来回重定向
+    if(isset($_COOKIE['user']) && (($_COOKIE['user'].$_COOKIE['password']) == $config['authtoken'])) {
         header('Location:index.php');
+        exit;
     }
 ?>
 <?php
@@ -1,7 +1,8 @@
 <?php
     //清除COOKIE
-    setcookie("user", '', time()-3600,"/");
-    setcookie("password", '', time()-3600,"/");
+    setcookie("user", '', $_SERVER['REQUEST_TIME']-3600,"/");
+    setcookie("password", '', $_SERVER['REQUEST_TIME']-3600,"/");
 
-    echo "<script>window.location.href = './login.php'</script>";
+    //直接发302跳转，不必等浏览器解析页面里的JS再跳一次
+    header('Location:login.php');
 ?>
\ No newline at end of file
@@ -10,12 +10,8 @@
     $page = $_GET['page'];
     //查询图片
     $imgs = $pic->querypic($type,$page);
-    
-    $up = (int)$page - 1;
-    if($up <= 0){
-        $up = 1;
-    }
-    $down = (int)$page +1;
+    //循环里用到的域名先取出来，不必每行都查一次配置数组
+    $domain = $config['domain'];
 ?>
 
 <div class="layui-container" style = "margin-top:2em;">
@@ -28,7 +24,7 @@
          <div id = "adminpic">
          <div class="layui-col-lg9 layui-col-space10">
             <?php foreach ($imgs as $img) {
-                $imgurl = $config['domain'].$img['path'];
+                $imgurl = $domain.$img['path'];
                 $id = $img['id'];
             ?>
             <div class="layui-col-lg4 picadmin">
@@ -36,14 +32,7 @@
             </div>
             <?php } ?>
         </div>
-        <!-- 翻页按钮 -->
-        <div class="layui-col-lg9 layui-col-md-offset3">
-            <div class="page">
-                <a href="?type=<?php echo $type; ?>&page=<?php echo $up; ?>" class="layui-btn">上一页</a>
-                <a href="?type=<?php echo $type; ?>&page=<?php echo $down; ?>" class="layui-btn">下一页</a>
-            </div>
-        </div>
-        <!-- 翻页按钮END -->
+        <?php include_once("../tpl/admin/page.php"); ?>
         <!-- 后台内容部分END -->
     </div>
 </div>
@@ -10,12 +10,19 @@
     $page = $_GET['page'];
     //查询图片
     $imgs = $pic->querypic($type,$page);
-    
-    $up = (int)$page - 1;
-    if($up <= 0){
-        $up = 1;
-    }
-    $down = (int)$page +1;
+    //循环里用到的域名先取出来，不必每行都查一次配置数组
+    $domain = $config['domain'];
+    //压缩状态到按钮样式的映射，循环里直接按状态取，不再逐行if判断
+    $compressmap = array(
+        0   =>  array(
+            "css"       =>  "layui-btn layui-btn-xs layui-btn-danger",
+            "content"   =>  "否"
+        ),
+        1   =>  array(
+            "css"       =>  "layui-btn layui-btn-xs layui-btn-normal",
+            "content"   =>  "是"
+        )
+    );
 ?>
 
 <div class="layui-container" style = "margin-top:2em;">
@@ -30,6 +37,7 @@
             <!-- 表格 -->
             <table class="layui-table">
                 <colgroup>
+                    <col width="30">
                     <col width="30">
                     <col width="280">
                     <col width="120">
@@ -39,6 +47,7 @@
                 </colgroup>
                 <thead>
                     <tr>
+                    <th><input type="checkbox" onclick="checkall(this)" /></th>
                     <th>ID</th>
                     <th>图片路径（点击可查看）</th>
                     <th>IP</th>
@@ -49,24 +58,27 @@
                 </thead>
                 <tbody>
                 <?php foreach ($imgs as $img) {
-                    $imgurl = $config['domain'].$img['path'];
+                    $imgurl = $domain.$img['path'];
                     $id = $img['id'];
-                    $size = filesize('../'.$img['path']);     //文件大小计算
-                    $size = round($size / 1024)."kb";
-                    if($img['compress'] == 0) {
-                        $compress = array(
-                            "css"       =>  "layui-btn layui-btn-xs layui-btn-danger",
-                            "content"   =>  "否"
-                        );
-                    }
-                    else{
-                        $compress = array(
-                            "css"       =>  "layui-btn layui-btn-xs layui-btn-normal",
-                            "content"   =>  "是"
-                        );
+                    //优先使用上传时记录的大小，旧数据才读取文件
+                    //查询结果没有size键说明数据库还没升级到1.3，只读文件、不回写
+                    $size = isset($img['size']) ? $img['size'] : 0;
+                    if(!$size) {
+                        $size = filesize('../'.$img['path']);
+                        //算出来的大小回写数据库，下次直接读记录，不再碰文件
+                        if($size && isset($img['size'])) {
+                            $database->update("imginfo",[
+                                "size"  =>  $size
+                            ],[
+                                "id"    =>  $id
+                            ]);
+                        }
                     }
+                    $size = round($size / 1024)."kb";
+                    $compress = $compressmap[$img['compress'] == 0 ? 0 : 1];
                 ?>
                    <tr id = "imgid<?php echo $id; ?>">
+                        <td><input type="checkbox" class="batchck" value="<?php echo $id; ?>" /></td>
                         <td><?php echo $id; ?></td>
                         <td><a id = "imgid<?php echo $id; ?>" href="javascript:;" onclick = "adminshow('<?php echo $imgurl ?>',<?php echo $id; ?>)"><?php echo $img['path']; ?></a></td>
                         <td><a href="javascript:;" onclick = "ipquery('<?php echo $img['ip']; ?>')"><?php echo $img['ip']; ?></a></td>
@@ -88,16 +100,10 @@
                    <?php } ?>
                 </tbody>
             </table>
+            <a href="javascript:;" class="layui-btn layui-btn-sm layui-btn-danger" onclick="batchdelete()">删除选中</a>
             <!-- 表格END -->
         </div>
-        <!-- 翻页按钮 -->
-        <div class="layui-col-lg9 layui-col-md-offset3">
-            <div class="page">
-                <a href="?type=<?php echo $type; ?>&page=<?php echo $up; ?>" class="layui-btn">上一页</a>
-                <a href="?type=<?php echo $type; ?>&page=<?php echo $down; ?>" class="layui-btn">下一页</a>
-            </div>
-        </div>
-        <!-- 翻页按钮END -->
+        <?php include_once("../tpl/admin/page.php"); ?>
         
         <!-- 后台内容部分END -->
     </div>
@@ -10,13 +10,6 @@
     $page = $_GET['page'];
     //查询sm.ms图片
     $imgs = $pic->querysm($page);
-    //var_dump($imgs);
-    
-    $up = (int)$page - 1;
-    if($up <= 0){
-        $up = 1;
-    }
-    $down = (int)$page +1;
 ?>
 
 <div class="layui-container" style = "margin-top:2em;">
@@ -78,14 +71,7 @@
                 <?php } ?>
             <!-- 表格END -->
         </div>
-        <!-- 翻页按钮 -->
-        <div class="layui-col-lg9 layui-col-md-offset3">
-            <div class="page">
-                <a href="?type=<?php echo $type; ?>&page=<?php echo $up; ?>" class="layui-btn">上一页</a>
-                <a href="?type=<?php echo $type; ?>&page=<?php echo $down; ?>" class="layui-btn">下一页</a>
-            </div>
-        </div>
-        <!-- 翻页按钮END -->
+        <?php include_once("../tpl/admin/page.php"); ?>
         
         <!-- 后台内容部分END -->
     </div>
@@ -1,27 +1,10 @@
 <?php
 	echo "<h1>请将以下信息填写到配置文件config.php</h1>";
-	//获取当前端口
+	//获取当前端口，默认端口不拼进URL，443按https处理
 	$port = $_SERVER["SERVER_PORT"];
-	//对端口进行判断
-	switch ( $port )
-	{
-		case 80:
-			$protocol = "http://";
-			$port = '';
-			break;	
-		case 443:
-			$protocol = "https://";
-			$port = '';
-			break;
-		default:
-			$protocol = "http://";
-			$port = ":".$port;
-			break;
-	}
-	//获取项目绝对路径
-	$thedir = __DIR__;
-	$thedir = str_replace("\\","/",$thedir).'/';
-	echo "项目绝对路径：".$thedir."<br />";
+	$protocol = ($port == 443) ? "https://" : "http://";
+	$port = (($port == 80) || ($port == 443)) ? '' : ':'.$port;
+	//项目绝对路径已由config.php自动获取，无需填写
 
 	//或如URI
 	$uri =  $_SERVER["REQUEST_URI"];
@@ -30,5 +13,19 @@
 	$domain = $protocol.$_SERVER['SERVER_NAME'].$port.$uri;
 	echo "当前域名为：".$domain;
 	
+	//检查运行环境，性能相关的扩展缺失时在这里提示
+	echo "<h1>环境检查</h1>";
+	$exts = array(
+		"pdo_sqlite"	=>	"必需，数据库支持",
+		"curl"			=>	"必需，压缩与鉴黄接口",
+		"exif"			=>	"必需，图片上传",
+		"zlib"			=>	"建议开启，页面gzip压缩",
+		"Zend OPcache"	=>	"建议开启，缓存编译后的脚本，降低CPU开销"
+	);
+	foreach($exts as $ext => $desc) {
+		$status = extension_loaded($ext) ? '已开启' : '未开启';
+		echo $ext."（".$desc."）：".$status."<br />";
+	}
+
 	echo "<h1>配置完成后测试网站功能正常，请删除此文件。</h1>";
 ?>
\ No newline at end of file
@@ -1,6 +1,8 @@
 <?php
-    //项目绝对路径
-    define("APP","D:/wwwroot/imgurl/");
+    //统一设置错误报告级别，各入口不必再单独设置
+    error_reporting(E_ALL^E_NOTICE^E_WARNING^E_DEPRECATED);
+    //项目绝对路径，自动取当前目录，无需手动填写
+    define("APP",str_replace("\\","/",__DIR__)."/");
     
     //载入数据库类
     include_once(APP."functions/class/Medoo.php");
@@ -9,7 +11,7 @@
         "domain"    =>  "http://localhost/imgurl/", //站点地址
         "user"      =>  "xiaoz",                    //管理员账号
         "password"  =>  "xiaoz.me",                 //管理员密码
-        "limit"		=>	5,							//游客上传数量限制
+        "limit"		=>	5,							//游客上传数量限制，0表示不限制
         "watermark"	=>	"imgurl.org",				//图片文字水印
         "userdir"   =>  "temp",                     //游客上传目录，一般不用做修改
         "admindir"  =>  "upload",                   //管理员上传目录，一般不用做修改
@@ -29,10 +31,31 @@
         "key"       =>  "xxx"
     );
 
+    //载入时对配置做一次规范化，后续代码直接使用，无需再逐处处理
+    $config['domain'] = rtrim($config['domain'],'/').'/';   //保证域名以/结尾
+    $config['limit'] = (int)$config['limit'];               //上传限额转为整数
+    $tinypng['key'] = array_values(array_filter($tinypng['key']));  //去掉空的key
+    //管理员登录凭证提前算好，每次校验不用再重复md5
+    $config['authtoken'] = $config['user'].md5("imgurl".$config['password']);
+
 	//初始化Medoo
     use Medoo\Medoo;
-    $database = new medoo([
-        'database_type' => 'sqlite',
-        'database_file' => $config['datadir']
-    ]);
+    //纯展示页面只需要配置数组，定义IMGURL_NODB后跳过数据库初始化
+    if(!defined('IMGURL_NODB')) {
+        $database = new medoo([
+            'database_type' => 'sqlite',
+            'database_file' => $config['datadir'],
+            'option' => [
+                //持久连接，同一进程内复用已打开的数据库句柄，不必每次请求重新打开
+                PDO::ATTR_PERSISTENT => true
+            ],
+            'command' => [
+                //WAL模式下读写互不阻塞，写入也不必每次刷盘等待
+                'PRAGMA journal_mode = WAL',
+                'PRAGMA synchronous = NORMAL',
+                //写锁被占用时等待2秒，而不是立即报database is locked
+                'PRAGMA busy_timeout = 2000'
+            ]
+        ]);
+    }
 ?>
\ No newline at end of file
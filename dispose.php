@@ -1,33 +1,40 @@
 <?php
-    error_reporting(E_ALL^E_NOTICE^E_WARNING^E_DEPRECATED);
+    //压缩和写库要么都完成要么下次重来，客户端提前断开不中断处理
+    ignore_user_abort(true);
     //载入配置文件
     include_once("./config.php");
-    //载入TinyPNG
-    require_once("functions/tinypng/Tinify/Exception.php");
-    require_once("functions/tinypng/Tinify/ResultMeta.php");
-    require_once("functions/tinypng/Tinify/Result.php");
-    require_once("functions/tinypng/Tinify/Source.php");
-    require_once("functions/tinypng/Tinify/Client.php");
-    require_once("functions/tinypng/Tinify.php");
+    //载入curl封装
+    include_once("functions/class/class.http.php");
+    //载入缓存封装
+    include_once("functions/class/class.cache.php");
+    //仅在开启压缩时才载入TinyPNG，未开启时不必解析这一批文件
+    if($tinypng['option'] == true) {
+        require_once("functions/tinypng/load.php");
+    }
+
+    //压缩和鉴黄都未开启时结果是固定的，直接返回，不必查询数据库
+    if(($tinypng['option'] != true) && ($ModerateContent['option'] != true)) {
+        header('Content-Type: application/json; charset=utf-8');
+        echo '{"compress":0,"level":0,"code":1}';
+        exit;
+    }
 
     //初始化值
     $dispose['compress'] = 0;
     $dispose['level']   = 0;
+    //本次需要写回数据库的字段，统一在最后一次性更新
+    $changes = array();
 
-    //获取ID
+    //获取ID，先校验再做后面的准备工作
     $id = $_GET['id'];
     $id = (int)$id;
-    //获取tinypng key
-    $tinykey = array_rand($tinypng['key']);     //取出数组键值
-    $tinykey = $tinypng['key'][$tinykey];
-    //获取ModerateContent key
-    $mckey = $ModerateContent['key'];
-
     //如果ID不存在或为空
     if((!isset($id)) || ($id == '')) {
         echo 'ID错误！';
         exit;
     }
+    //获取ModerateContent key
+    $mckey = $ModerateContent['key'];
 
     //查询对应信息
     $info = $database->get("imginfo",[
@@ -45,52 +52,47 @@
     $compress = $info['compress'];
     //获取图片等级
     $level  = $info['level'];
-    //获取文件后缀名
-    $suffix =  substr(strrchr($info['path'], '.'), 1);
-    //后缀变为小写
-    $suffix = strtolower($suffix);
-    if(($suffix == 'png') || ($suffix == 'jpg') || ($suffix == 'jpeg')) {
-        $iscompress = 1;
-    }
+    //可压缩的后缀做成哈希表，一次isset完成判断
+    $compressext = array("png"=>1,"jpg"=>1,"jpeg"=>1);
+    //获取文件后缀名并转为小写
+    $suffix = strtolower(pathinfo($info['path'], PATHINFO_EXTENSION));
+    $iscompress = isset($compressext[$suffix]) ? 1 : 0;
     
-    //对图片进行压缩
+    //对图片进行压缩，压缩成功才记录状态
     if(($tinypng['option'] == true) && ($iscompress == 1) && ($compress == 0)) {
-        //初始化
-        \Tinify\setKey($tinykey);
-        $source = \Tinify\fromUrl($imgurl);
-        //覆盖原有图片
-        $source->toFile($info['path']);
-        //更新数据库
-        $database->update("imginfo",[
-            "compress"  =>  1
-        ],[
-            "id"    => $id
-        ]);
-        $dispose['compress'] = 1;
+        if(tinify_compress($tinypng['key'],APP.$info['path'])) {
+            $changes['compress'] = 1;
+            $dispose['compress'] = 1;
+        }
     }
     //对图片进行鉴黄
     if(($ModerateContent['option'] == true) && ($level == 0)) {
         $apiurl = "https://www.moderatecontent.com/api/v2?key=".$mckey."&url=".$imgurl;
-        $curl = curl_init($apiurl);
+        //复用共享curl句柄请求鉴黄接口
+        $html = Http::get($apiurl,10);
 
-        curl_setopt($curl, CURLOPT_USERAGENT, "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/66.0.3359.117 Safari/537.36");
-        curl_setopt($curl, CURLOPT_FAILONERROR, true);
-        curl_setopt($curl, CURLOPT_FOLLOWLOCATION, true);
-        curl_setopt($curl, CURLOPT_RETURNTRANSFER, true);
-        curl_setopt($curl, CURLOPT_SSL_VERIFYPEER, false);
-        curl_setopt($curl, CURLOPT_SSL_VERIFYHOST, false);
-
-        $html = curl_exec($curl);
-        curl_close($curl);
-
-        //更新数据库
+        //接口超时或返回异常时跳过，等待下次再鉴黄
         $html = json_decode($html);
-        $level = $html->rating_index;
-        $database->update("imginfo",["level" =>  $level],["id"   => $id]);
-        $dispose['level'] = $level;
+        if(isset($html->rating_index)) {
+            $level = $html->rating_index;
+            $changes['level'] = $level;
+            $dispose['level'] = $level;
+        }
+    }
+    //压缩和鉴黄的结果合并为一次数据库更新
+    if(!empty($changes)) {
+        $database->update("imginfo",$changes,["id"   =>  $id]);
+        //鉴黄结果会影响后台的可疑图片统计，清除统计缓存
+        if(isset($changes['level'])) {
+            Cache::bust("stats");
+            //被判定为可疑的图片不应继续出现在探索发现页，同步清除本月候选缓存
+            if($changes['level'] >= 3) {
+                Cache::bust("found-".date('Y-m',$_SERVER['REQUEST_TIME']));
+            }
+        }
     }
     //返回json数据
+    header('Content-Type: application/json; charset=utf-8');
     $dispose['code'] = 1;
-    $dispose = json_encode($dispose);
-    echo $dispose;
+    echo json_encode($dispose,JSON_UNESCAPED_UNICODE|JSON_UNESCAPED_SLASHES);
 ?>
\ No newline at end of file
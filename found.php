@@ -3,16 +3,49 @@
     include_once("./tpl/user/header.php");
     // 载入类
     include_once("config.php");
+    //载入缓存封装
+    include_once("functions/class/class.cache.php");
     
-    //获取当前时间
-    $thetime = date('Y-m',time());
+    //获取当前时间，复用请求开始时间
+    $thetime = date('Y-m',$_SERVER['REQUEST_TIME']);
     
     //初始化
     $domain = $config['domain'];
     $userdir = $config['userdir'];
-    $sql = "SELECT `id`,`path` FROM `imginfo` WHERE (`dir` = '$userdir' AND `level` < 3 AND `date` LIKE '$thetime%') ORDER BY random() LIMIT 12";
-    $datas = $database->query($sql)->fetchAll();
-    
+
+    //本月候选图片列表缓存5分钟，过期才重新查库，随机挑选放在PHP里完成
+    $cachename = "found-".$thetime;
+    $all = Cache::get($cachename,300);
+    if($all === false) {
+        //走Medoo的参数绑定，月份等条件作为参数传入，不再拼接SQL字符串
+        $all = $database->select("imginfo",["id","path"],[
+            "AND"   =>  [
+                "dir"       =>  $userdir,
+                "level[<]"  =>  3,
+                "date[~]"   =>  $thetime.'%'
+            ]
+        ]);
+        //顺手清理往月遗留的缓存文件，temp目录不会越积越多
+        foreach (glob(APP."temp/found-*.cache") as $oldcache) {
+            if($oldcache != APP."temp/".$cachename.".cache") {
+                @unlink($oldcache);
+            }
+        }
+        Cache::set($cachename,$all);
+    }
+    //从候选列表里随机取12张
+    if(count($all) > 12) {
+        $keys = array_rand($all,12);
+        $datas = array();
+        foreach($keys as $key) {
+            $datas[] = $all[$key];
+        }
+    }
+    else{
+        $datas = $all;
+        shuffle($datas);
+    }
+
 ?>
 
 <div class="layui-container" style = "margin-bottom:6em;">
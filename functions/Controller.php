@@ -17,9 +17,6 @@
             );
             $basis->login($user,$admin);
             break;
-        case 'check': 
-            $basis->check($config);
-            break;
         default:
             # code...
             break;
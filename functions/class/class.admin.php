@@ -1,16 +1,25 @@
 <?php
-    error_reporting(E_ALL^E_NOTICE^E_WARNING^E_DEPRECATED);
     // 载入配置文件
     include_once("../config.php");
+    // 载入curl封装
+    include_once("class.http.php");
+    // 载入缓存封装
+    include_once("class.cache.php");
 
     class Admin{
         var $config;
         var $database;
+        //图片列表类型到查询条件的映射，初始化时组装一次
+        var $querymap;
         function __construct($config,$database) {
             $this->config = $config;
             $this->database = $database;
-            $user1 = $config['user'].md5("imgurl".$config['password']);
-            // echo $user1;
+            $this->querymap = array(
+                "user"      =>  ["dir"      =>  $config['userdir']],
+                "admin"     =>  ["dir"      =>  $config['admindir']],
+                "dubious"   =>  ["level"    =>  3]
+            );
+            $user1 = $config['authtoken'];
             //COOKIES里面的信息
             $user2 = $_COOKIE['user'].$_COOKIE['password'];
             
@@ -18,157 +27,130 @@
             if($user1 != $user2) {
                 echo '权限不足，请先登录！';
                 //清理cookie
-                setcookie("user", '', time()-3600,"/");
-                setcookie("password", '', time()-3600,"/");
+                setcookie("user", '', $_SERVER['REQUEST_TIME']-3600,"/");
+                setcookie("password", '', $_SERVER['REQUEST_TIME']-3600,"/");
                 header('Location:login.php');
                 exit;
             } 
         }
         //查询图片
         function querypic($type,$page){
-            $config = $this->config;
             $database = $this->database;
 
-            //分页计算
-            $start = ($page - 1) * 12;
-            //$end = $page * 12;
-
-            if(($page == '') || (!isset($page))) {
+            //页码先转成整数并兜底为1，再计算偏移，避免负数OFFSET
+            $page = (int)$page;
+            if($page < 1) {
                 $page = 1;
             }
-            
+            //分页计算
+            $start = ($page - 1) * 12;
             //要查询的条数
             $num = 12;
 
-            //判断类型
-            switch ($type) {
-                case 'user':
-                    // echo 'dsd';
-                    $datas = $database->select("imginfo", "*", [
-                        "dir" => $config['userdir'],
-                        "ORDER" => ["id" => "DESC"],
-	                    "LIMIT" => [$start,$num]
-                    ]);
-                    // var_dump( $database->log() );
-                    // exit;
-                    return $datas;  
-                    break;
-                case 'admin':
-                    $datas = $database->select("imginfo", "*", [
-                        "dir" => $config['admindir'],
-                        "ORDER" => ["id" => "DESC"],
-                        "LIMIT" => [$start,$num]
-                    ]);
-                    return $datas;
-                    break; 
-                case 'dubious':
-                    $datas = $database->select("imginfo", "*", [
-                        "level" => 3,
-                        "ORDER" => ["id" => "DESC"],
-                        "LIMIT" => [$start,$num]
-                    ]);
-                    return $datas;
-                    break; 
-                default:
-                    echo 'dsddsd';
-                    break;
+            //未知类型返回空列表
+            if(!isset($this->querymap[$type])) {
+                return array();
             }
+            $where = $this->querymap[$type];
+            $where["ORDER"] = ["id" => "DESC"];
+            $where["LIMIT"] = [$start,$num];
+            return $database->select("imginfo", "*", $where);
         }
-        //删除一张图片
-        function delete($id){
-            $config = $this->config;
+        //删除图片，支持单个ID或逗号分隔的多个ID，批量时只做一次数据库删除
+        function delete($ids){
             $database = $this->database;
+            //统一转为整数ID数组
+            if(!is_array($ids)) {
+                $ids = explode(',',(string)$ids);
+            }
+            $ids = array_filter(array_map('intval',$ids));
+            if(empty($ids)) {
+                echo 'ID错误';
+                return;
+            }
             //先查询数据库获取图片路径
-            $path = $database->get("imginfo","path",[
-                "id"    =>  $id
+            $datas = $database->select("imginfo",["id","path"],[
+                "id"    =>  $ids
             ]);
-            
-            
-            //完整的图片路径
-            $imgpath = APP.$path;
-            //如果图片删除成功，将再次删除数据库
-            
-            if(unlink($imgpath)) {
-                $del = $database->delete("imginfo", [
-                    "AND" => [
-                        "id" => $id
-                    ]
+            //逐个删除文件，记录删除成功的ID
+            $delids = array();
+            foreach($datas as $data) {
+                if(unlink(APP.$data['path'])) {
+                    $delids[] = $data['id'];
+                }
+            }
+            //文件删除成功的记录一次性从数据库删除
+            if(!empty($delids)) {
+                $database->delete("imginfo", [
+                    "id" => $delids
                 ]);
+                //数据有变化，清除统计缓存，探索发现页的本月候选缓存一并清除
+                Cache::bust(array("stats","found-".date('Y-m',$_SERVER['REQUEST_TIME'])));
+            }
+            //全部删除成功才返回ok，否则把失败的ID报给前端
+            if(count($delids) == count($ids)) {
                 echo 'ok';
             }
             else{
-                echo '删除失败！';
+                echo '删除失败的ID：'.implode(',',array_diff($ids,$delids));
             }
-            
         }
         //统计数据
         function data() {
-            //获取当前月份
-            $themonth = date('Y-m',time());
-            //获取当天时间
-            $theday = date('Y-m-d',time());
-            
-            //统计本月上传图片数量
-            $month = $this->database->count("imginfo",[
-                "date[~]"  =>  $themonth
-            ]);
-            
-            $day = $this->database->count("imginfo",[
-                "date"  =>  $theday
-            ]);
-            
-            //统计可疑图片
-            $level = $this->database->count("imginfo",[
-                "level"  =>  3
-            ]);
-            
+            //数据有变化的地方都会主动清除缓存，这里的时长只作为兜底
+            $redata = Cache::get("stats",3600);
+            if(is_array($redata)) {
+                return $redata;
+            }
+            //获取当前月份和当天时间，复用请求开始时间
+            $themonth = date('Y-m',$_SERVER['REQUEST_TIME']);
+            $theday = date('Y-m-d',$_SERVER['REQUEST_TIME']);
+
+            //一条SQL同时统计本月上传、今日上传和可疑图片，避免扫描三次表
+            $sql = "SELECT
+                SUM(CASE WHEN `date` LIKE '$themonth%' THEN 1 ELSE 0 END) AS `month`,
+                SUM(CASE WHEN `date` = '$theday' THEN 1 ELSE 0 END) AS `day`,
+                SUM(CASE WHEN `level` = 3 THEN 1 ELSE 0 END) AS `level`
+                FROM `imginfo`";
+            $data = $this->database->query($sql)->fetch();
+
             //返回数据
             $redata = array(
-                "month" =>  $month,
-                "day"   =>  $day,
-                "level" =>  $level
+                "month" =>  (int)$data['month'],
+                "day"   =>  (int)$data['day'],
+                "level" =>  (int)$data['level']
             );
+            //写入缓存，下次直接使用
+            Cache::set("stats",$redata);
             return $redata;
         }
         //取消图片可疑状态
         function cdubious($id){
             $database = $this->database;
-            $database->update("imginfo",[
+            //只更新仍处于可疑状态的记录，重复点击不会产生多余的写入
+            $data = $database->update("imginfo",[
                 "level"     =>  1
             ],[
-                "id"        =>  $id
+                "id"        =>  $id,
+                "level"     =>  3
             ]);
-            echo 'ok';
-        }
-        //对某张图片进行压缩，未开发完成
-        function compress($id,$tinypng){
-            $database = $this->database;
-            $config = $this->config;
-            if($tinypng['option'] != true){
-                $compress['code'] = 0;
-                $compress['msg'] = "未开启图片压缩功能！";
-            }
-            else{
-                $getdata = $database->get("imginfo","*",[
-                    "id"    =>  $id
-                ]);
-                
+            //确实有变化才清除统计缓存
+            if($data->rowCount() > 0) {
+                Cache::bust("stats");
             }
+            echo 'ok';
         }
         //查询SM.MS图片
-        //查询图片
         function querysm($page){
-            $config = $this->config;
             $database = $this->database;
 
-            //分页计算
-            $start = ($page - 1) * 12;
-            //$end = $page * 12;
-
-            if(($page == '') || (!isset($page))) {
+            //页码先转成整数并兜底为1，再计算偏移，避免负数OFFSET
+            $page = (int)$page;
+            if($page < 1) {
                 $page = 1;
             }
-            
+            //分页计算
+            $start = ($page - 1) * 12;
             //要查询的条数
             $num = 12;
 
@@ -192,21 +174,21 @@
                     "id" => $id
                 ]
             ]);
-            //请求接口删除图片
-            $curl = curl_init($query['delete']);
-
-            curl_setopt($curl, CURLOPT_USERAGENT, "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/66.0.3359.139 Safari/537.36");
-            curl_setopt($curl, CURLOPT_FAILONERROR, true);
-            curl_setopt($curl, CURLOPT_FOLLOWLOCATION, true);
-            curl_setopt($curl, CURLOPT_RETURNTRANSFER, true);
-            curl_setopt($curl, CURLOPT_SSL_VERIFYPEER, false);
-            curl_setopt($curl, CURLOPT_SSL_VERIFYHOST, false);
-            #设置超时时间，最小为1s（可选）
-            curl_setopt($curl , CURLOPT_TIMEOUT, 2);
-
-            $html = curl_exec($curl);
-            curl_close($curl);
+            //先把结果返回给前端，远程接口的删除放在响应之后进行
+            //避免SM.MS接口慢时后台页面跟着卡住
+            ignore_user_abort(true);
             echo 'ok';
+            if(function_exists('fastcgi_finish_request')) {
+                fastcgi_finish_request();
+            }
+            else{
+                while(ob_get_level() > 0) {
+                    ob_end_flush();
+                }
+                flush();
+            }
+            //请求接口删除图片
+            $html = Http::get($query['delete'],2);
         }
     }
 
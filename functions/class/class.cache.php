@@ -0,0 +1,35 @@
+<?php
+    /*
+    temp目录文件缓存的统一封装
+    读取、写入、失效都走这里，调用方不再各自拼路径和处理过期
+    */
+    class Cache{
+        //缓存文件完整路径
+        private static function path($name){
+            return APP."temp/".$name.".cache";
+        }
+        //读取缓存，过期或不存在返回false
+        public static function get($name,$ttl){
+            $file = self::path($name);
+            if(is_file($file) && ($_SERVER['REQUEST_TIME'] - filemtime($file) < $ttl)) {
+                $data = unserialize(file_get_contents($file));
+                if($data !== false) {
+                    return $data;
+                }
+            }
+            return false;
+        }
+        //写入缓存，先写临时文件再rename原子替换
+        public static function set($name,$data){
+            $file = self::path($name);
+            file_put_contents($file.".tmp",serialize($data));
+            rename($file.".tmp",$file);
+        }
+        //清除一个或多个缓存
+        public static function bust($names){
+            foreach((array)$names as $name) {
+                @unlink(self::path($name));
+            }
+        }
+    }
+?>
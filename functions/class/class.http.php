@@ -0,0 +1,39 @@
+<?php
+    /*
+    简单的curl封装
+    同一次请求内复用同一个curl句柄，连接可以保持，不必每次重新初始化
+    */
+    class Http{
+        //共享的curl句柄
+        private static $curl = NULL;
+
+        //发起GET请求，返回响应内容，失败返回false
+        public static function get($url,$timeout = 10){
+            if(self::$curl == NULL){
+                self::$curl = curl_init();
+                //固定不变的选项只在句柄创建时设置一次
+                curl_setopt_array(self::$curl, array(
+                    CURLOPT_USERAGENT => "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/66.0.3359.139 Safari/537.36",
+                    CURLOPT_FAILONERROR => true,
+                    CURLOPT_FOLLOWLOCATION => true,
+                    CURLOPT_RETURNTRANSFER => true,
+                    CURLOPT_SSL_VERIFYPEER => false,
+                    CURLOPT_SSL_VERIFYHOST => false,
+                    #连接超时固定5秒，防止接口过慢时长时间阻塞
+                    CURLOPT_CONNECTTIMEOUT => 5,
+                    #允许服务端返回gzip等压缩内容，减少传输量
+                    CURLOPT_ENCODING => "",
+                    #关闭Nagle算法，小请求不再等待凑包，降低接口延迟
+                    CURLOPT_TCP_NODELAY => true,
+                    #句柄内保留少量长连接，同一主机的连续请求走keep-alive
+                    CURLOPT_MAXCONNECTS => 5
+                ));
+            }
+            $curl = self::$curl;
+            //每次调用只需设置URL和总超时
+            curl_setopt($curl, CURLOPT_URL, $url);
+            curl_setopt($curl, CURLOPT_TIMEOUT, $timeout);
+            return curl_exec($curl);
+        }
+    }
+?>
@@ -1,5 +1,4 @@
 <?php
-    error_reporting(E_ALL^E_NOTICE^E_WARNING^E_DEPRECATED);
     // 载入配置文件
     include_once("../config.php");
 
@@ -15,76 +14,73 @@
 
         // 用户登录，两个参数，一个是用户输入，一个是配置文件里面的用户信息
         function login($user,$admin){
-            
-            // 用户输入的信息进行md5加密和对比
-            $pw1 = md5($user['user'].$user['password']);
-            $pw2 = md5($admin['user'].$admin['password']);
-            
+            //用户名和密码分开比较，不再拼接后整体md5（拼接会让ab+c和a+bc无法区分）
+            //口令比较走hash_equals，耗时恒定，错在哪一位都不会被比较时间暴露
+            $checkuser = hash_equals((string)$admin['user'],(string)$user['user']);
+            $checkpw = hash_equals(md5((string)$admin['password']),md5((string)$user['password']));
 
             // 判断用户名密码是否正确
-            if($pw1 != $pw2){
+            if(!($checkuser && $checkpw)){
                 echo '用户名或密码不正确！';
-                setcookie("user", '', time()-3600,"/");
-                setcookie("password", '', time()-3600,"/");
+                setcookie("user", '', $_SERVER['REQUEST_TIME']-3600,"/");
+                setcookie("password", '', $_SERVER['REQUEST_TIME']-3600,"/");
                 exit;
             }
             else{
                 $password = md5("imgurl".$admin['password']);
                 //生成cookie
-                setcookie("user", $user['user'], time()+3600 * 24 * 30,"/");
-                setcookie("password", $password, time()+3600 * 24 * 30,"/");
+                setcookie("user", $user['user'], $_SERVER['REQUEST_TIME']+3600 * 24 * 30,"/");
+                setcookie("password", $password, $_SERVER['REQUEST_TIME']+3600 * 24 * 30,"/");
                 echo "<script>window.location.href = './index.php'</script>";
                 exit;
             }
         }
         //判断用户状态
         function check($userinfo){
-            //配置文件里面的用户信息
-            $user1 = $userinfo['user'].md5("imgurl".$userinfo['password']);
-            // echo $user1;
+            //配置文件里面的用户信息（config.php已提前算好）
+            $user1 = $userinfo['authtoken'];
             //COOKIES里面的信息
             $user2 = $_COOKIE['user'].$_COOKIE['password'];
             
             //如果两者信息相符，说明已登录
             if($user1 == $user2) {
-                return'islogin';
-                exit;
-            }
-            else{
-                return 'nologin';
-                setcookie("user", '', time()-3600,"/");
-                setcookie("password", '', time()-3600,"/");
-                exit;
+                return 'islogin';
             }
+            return 'nologin';
         }
         //检查某张图片是否已经上传
         function isupload($path){
-            $num = $this->database->count("imginfo",["path"   =>  $path]);
+            //直接取记录，是否上传过由查询结果本身判断，不再单独count一次
+            $info = $this->database->get("imginfo","*",["path"  =>  $path]);
 
             //如果图片已经上传过，直接返回图片信息
-            if($num >=1) {
-                $info = $this->database->get("imginfo","*",["path"  =>  $path]);
+            if($info) {
                 $imgurl = $this->config['domain'].$path;
                 //返回json数据
+                //重复上传的图片此前已经处理过，告诉前端不必再请求dispose.php
                 $redata = array(
                     "code"      =>  1,
                     "id"        =>  $info['id'],
                     "url"       =>  $imgurl,
                     "width"     =>  0,
-                    "height"    =>  0
+                    "height"    =>  0,
+                    "dispose"   =>  0
                 );
-                echo $redata = json_encode($redata);
+                echo json_encode($redata,JSON_UNESCAPED_UNICODE|JSON_UNESCAPED_SLASHES);
                 exit;
             }
         }
         //限制访客上传数量
         function limitnum(){
-            //获取访客IP
-            $ip = $_SERVER['REMOTE_ADDR'];
-            //获取当前时间
-            $date = date('Y-m-d',time());
-            //获取配置文件限额
+            //获取配置文件限额，0表示不限制，无需再查询数据库
             $limit = $this->config['limit'];
+            if($limit <= 0) {
+                return;
+            }
+            //获取访客IP，与入库时保持同一来源
+            $ip = $this->getip();
+            //获取当前时间，直接复用请求开始时间，不再调用time()
+            $date = date('Y-m-d',$_SERVER['REQUEST_TIME']);
             //获取用户上传目录
             $dir = $this->config['userdir'];
             //查询数据库统计数量
@@ -96,36 +92,32 @@
             ]);
             
             if($num >= $limit) {
-                $redata = array(
-                    "code"      =>  0,
-                    "msg"       =>  "上传达到限制！"
-                );
-                echo $redata = json_encode($redata);
+                //固定不变的响应直接输出现成的JSON，不必每次再组数组编码
+                echo '{"code":0,"msg":"上传达到限制！"}';
                 exit;
             }
         }
-        //获取访客真实IP
+        //获取访客真实IP，同一次请求内只解析一次
         function getip(){
-            if (getenv('HTTP_CLIENT_IP')) { 
-                    $ip = getenv('HTTP_CLIENT_IP'); 
-                } 
-                elseif (getenv('HTTP_X_FORWARDED_FOR')) { 
-                    $ip = getenv('HTTP_X_FORWARDED_FOR'); 
-                } 
-                elseif (getenv('HTTP_X_FORWARDED')) { 
-                    $ip = getenv('HTTP_X_FORWARDED'); 
-                } 
-                elseif (getenv('HTTP_FORWARDED_FOR')) { 
-                    $ip = getenv('HTTP_FORWARDED_FOR'); 
-            
-                } 
-                elseif (getenv('HTTP_FORWARDED')) { 
-                    $ip = getenv('HTTP_FORWARDED'); 
-                } 
-                else { 
-                    $ip = $_SERVER['REMOTE_ADDR']; 
-                } 
-                return $ip; 
+            static $cached = NULL;
+            if($cached !== NULL) {
+                return $cached;
+            }
+            //候选头按优先级排列，循环取第一个有值的，每个头只读一次
+            $headers = array(
+                'HTTP_CLIENT_IP',
+                'HTTP_X_FORWARDED_FOR',
+                'HTTP_X_FORWARDED',
+                'HTTP_FORWARDED_FOR',
+                'HTTP_FORWARDED'
+            );
+            foreach($headers as $header) {
+                $ip = getenv($header);
+                if($ip) {
+                    return $cached = $ip;
+                }
+            }
+            return $cached = $_SERVER['REMOTE_ADDR'];
         }
        
     }
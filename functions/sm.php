@@ -1,34 +1,37 @@
 <?php
 	//载入类
 	include_once("./class/class.user.php");
+	//本接口统一返回json
+	header('Content-Type: application/json; charset=utf-8');
 	//获取sm.ms API返回数据
 	$data = $_POST['data'];
-	//获取访客IP
-	$sm['ip'] = $basis->getip();
-	//获取访客UA
-	$sm['ua'] = $_SERVER['HTTP_USER_AGENT'];
-	//获取当前时间
-	$sm['date'] = date('Y-m-d',time());
-	//获取图片URL
-	$sm['url'] = $data['url'];
-	//获取删除链接
-	$sm['delete'] = $data['delete'];
 
-	//进行基本的判断
+	//先完成全部校验，通过后才组装数据
 	if((!isset($data)) || ($data == '') || (!is_array($data))) {
-		echo '获取数据失败！';
+		echo '{"code":0,"msg":"获取数据失败！"}';
 		exit;
 	}
-	//再次判断地址是否合法
-	if(!filter_var($sm['url'], FILTER_VALIDATE_URL)) {
-		echo '不是合法的地址！';
+	//判断地址是否合法
+	if(!filter_var($data['url'], FILTER_VALIDATE_URL)) {
+		echo '{"code":0,"msg":"不是合法的地址！"}';
 		exit;
 	}
-	if(!filter_var($sm['delete'], FILTER_VALIDATE_URL)) {
-		echo '不是合法的地址！';
+	if(!filter_var($data['delete'], FILTER_VALIDATE_URL)) {
+		echo '{"code":0,"msg":"不是合法的地址！"}';
 		exit;
 	}
 
+	//获取访客IP
+	$sm['ip'] = $basis->getip();
+	//获取访客UA
+	$sm['ua'] = $_SERVER['HTTP_USER_AGENT'];
+	//获取当前时间，复用请求开始时间
+	$sm['date'] = date('Y-m-d',$_SERVER['REQUEST_TIME']);
+	//获取图片URL
+	$sm['url'] = $data['url'];
+	//获取删除链接
+	$sm['delete'] = $data['delete'];
+
 	//写入数据库
 	$last_user_id = $database->insert("sm", [
 		"ip" 	=> $sm['ip'],
@@ -37,23 +40,22 @@
 		"url"	=> $sm['url'],
 		"delete"=> $sm['delete']
 	]);
-	//返回ID
-	$smid = $database->id();
 	if($last_user_id) {
+		//写入成功才需要查询新记录的ID
 		$redata = array(
 			"code"	=>	1,
-			"id"	=>	$smid,
+			"id"	=>	$database->id(),
 			"msg"	=>	"写入成功！"	
 		);
-		echo json_encode($redata);
+		echo json_encode($redata,JSON_UNESCAPED_UNICODE|JSON_UNESCAPED_SLASHES);
 		exit;
 	}
 	else{
 		$redata = array(
 			"code"	=>	0,
-			"id"	=>	$smid,
+			"id"	=>	0,
 			"msg"	=>	"该图片可能已经上传过！"	
 		);
-		echo json_encode($redata);
+		echo json_encode($redata,JSON_UNESCAPED_UNICODE|JSON_UNESCAPED_SLASHES);
 	}
 ?>
\ No newline at end of file
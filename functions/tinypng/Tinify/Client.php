@@ -9,6 +9,7 @@ class Client {
     const RETRY_DELAY = 500;
 
     private $options;
+    private $request;
 
     public static function userAgent() {
         $curl = curl_version();
@@ -34,6 +35,9 @@ class Client {
         $this->options = array(
             CURLOPT_BINARYTRANSFER => true,
             CURLOPT_RETURNTRANSFER => true,
+            CURLOPT_CONNECTTIMEOUT => 10,
+            CURLOPT_TIMEOUT => 60,
+            CURLOPT_TCP_NODELAY => true,
             CURLOPT_HEADER => true,
             CURLOPT_USERPWD => "api:" . $key,
             CURLOPT_CAINFO => self::caBundle(),
@@ -65,6 +69,12 @@ class Client {
         }
     }
 
+    function __destruct() {
+        if ($this->request) {
+            curl_close($this->request);
+        }
+    }
+
     function request($method, $url, $body = NULL) {
         $header = array();
         if (is_array($body)) {
@@ -81,12 +91,24 @@ class Client {
                 usleep(self::RETRY_DELAY * 1000);
             }
 
-            $request = curl_init();
+            /* Reuse the curl handle kept on the client so retries and
+               subsequent requests share the same connection. curl_reset
+               clears per-request options but keeps the connection cache. */
+            $request = $this->request;
+            if ($request === false || $request === null) {
+                $request = curl_init();
+            } elseif (function_exists("curl_reset")) {
+                curl_reset($request);
+            } else {
+                curl_close($request);
+                $request = curl_init();
+            }
             if ($request === false || $request === null) {
                 throw new ConnectionException(
                     "Error while connecting: curl extension is not functional or disabled."
                 );
             }
+            $this->request = $request;
 
             curl_setopt_array($request, $this->options);
 
@@ -107,7 +129,6 @@ class Client {
             if (is_string($response)) {
                 $status = curl_getinfo($request, CURLINFO_HTTP_CODE);
                 $headerSize = curl_getinfo($request, CURLINFO_HEADER_SIZE);
-                curl_close($request);
 
                 $headers = self::parseHeaders(substr($response, 0, $headerSize));
                 $body = substr($response, $headerSize);
@@ -135,7 +156,10 @@ class Client {
                 throw Exception::create($details->message, $details->error, $status);
             } else {
                 $message = sprintf("%s (#%d)", curl_error($request), curl_errno($request));
+                /* Connection-level failure: throw the handle away so the
+                   next attempt starts from a fresh one. */
                 curl_close($request);
+                $this->request = null;
                 if ($retries > 0) continue;
                 throw new ConnectionException("Error while connecting: " . $message);
             }
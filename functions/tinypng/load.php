@@ -0,0 +1,32 @@
+<?php
+    /*
+    TinyPNG载入器，按依赖顺序载入全部类文件
+    需要压缩功能的入口统一include本文件，不再各自维护一份清单
+    */
+    require_once(__DIR__."/Tinify/Exception.php");
+    require_once(__DIR__."/Tinify/ResultMeta.php");
+    require_once(__DIR__."/Tinify/Result.php");
+    require_once(__DIR__."/Tinify/Source.php");
+    require_once(__DIR__."/Tinify/Client.php");
+    require_once(__DIR__."/Tinify.php");
+
+    //用可用的key压缩图片，当前key额度用完(AccountException)时自动换下一个
+    function tinify_compress($keys,$file){
+        //打乱顺序，把压缩量分摊到各个key上
+        shuffle($keys);
+        foreach($keys as $key) {
+            try{
+                \Tinify\setKey($key);
+                //直接上传本地文件，省去TinyPNG回源拉取图片的一趟HTTP请求
+                $source = \Tinify\fromFile($file);
+                $source->toFile($file);
+                return true;
+            }
+            catch(\Tinify\AccountException $e) {
+                //key无效或本月额度已用完，换下一个key重试
+                continue;
+            }
+        }
+        return false;
+    }
+?>
@@ -1,6 +1,12 @@
 <?php
     //载入配置文件
     include_once("./class/class.user.php");
+    //载入缓存封装
+    include_once("./class/class.cache.php");
+
+    //本接口统一返回json，先于所有可能提前输出的检查设置
+    header('Content-Type: application/json; charset=utf-8');
+
     //检查用户是否登录
     $status = $basis->check($config);
 
@@ -15,10 +21,43 @@
         $basis->limitnum();
     }
 
+    //在载入上传类之前先做基本检查，过大或无效的文件直接拒绝，避免做无用功
+    if((!isset($_FILES['file'])) || ($_FILES['file']['error'] != 0)) {
+        $redata = array(
+            "code"  =>  0,
+            "msg"   =>  "没有接收到文件！"
+        );
+        echo json_encode($redata,JSON_UNESCAPED_UNICODE|JSON_UNESCAPED_SLASHES);
+        exit;
+    }
+    //允许上传大小2m
+    if($_FILES['file']['size'] > 2097152) {
+        $redata = array(
+            "code"  =>  0,
+            "msg"   =>  "图片超过2M限制！"
+        );
+        echo json_encode($redata,JSON_UNESCAPED_UNICODE|JSON_UNESCAPED_SLASHES);
+        exit;
+    }
+
+    //允许的图片扩展名做成哈希表，载入上传类之前一次isset就能判断
+    $allowext = array("jpg"=>1,"jpeg"=>1,"png"=>1,"gif"=>1,"bmp"=>1,"webp"=>1,"ico"=>1);
+    $ext = strtolower(pathinfo($_FILES['file']['name'], PATHINFO_EXTENSION));
+    if(!isset($allowext[$ext])) {
+        $redata = array(
+            "code"  =>  0,
+            "msg"   =>  "仅支持上传图片文件！"
+        );
+        echo json_encode($redata,JSON_UNESCAPED_UNICODE|JSON_UNESCAPED_SLASHES);
+        exit;
+    }
+
     //获取上传者信息
     $ip = $basis->getip();
     $ua = $_SERVER['HTTP_USER_AGENT'];
-    $date = date('Y-m-d',time());
+    //同一次上传只取一次时间，保证日期和月份目录一致（跨月临界时不会错位）
+    $now = $_SERVER['REQUEST_TIME'];
+    $date = date('Y-m-d',$now);
     //载入上传类
     include('./class/class.upload.php');
 
@@ -32,7 +71,7 @@
         $handle->allowed = array('image/*');
 
         // 当前月份
-        $current_time = date('ym',time());
+        $current_time = date('ym',$now);
         //上传路径：目录 + 时间
         $handle->process('../'.$updir.'/'.$current_time."/");
         if ($handle->processed) {
@@ -41,12 +80,14 @@
             //生成文件hash
             $fhash = hash_file("md5",$handle->file_dst_pathname,FALSE);
             $fhash = substr($fhash,8,16);
+            //文件名只拼接一次，路径和URL都由它派生
+            $fname = $fhash.'.'.$handle->file_dst_name_ext;
             //新的文件名(../temp/1804/\d64c8036c0605175.jpg)
-            $new_img = $handle->file_dst_path.$fhash.'.'.$handle->file_dst_name_ext;
-            //图片URL地址
-            $imgurl = $domain.$updir.'/'.$current_time.'/'.$fhash.'.'.$handle->file_dst_name_ext;
+            $new_img = $handle->file_dst_path.$fname;
             //图片路径(temp/1804/d64c8036c0605175.jpg)
-            $imgdir = $updir.'/'.$current_time.'/'.$fhash.'.'.$handle->file_dst_name_ext;
+            $imgdir = $updir.'/'.$current_time.'/'.$fname;
+            //图片URL地址
+            $imgurl = $domain.$imgdir;
 
             //判断文件是否已经存在
             if(!is_file($new_img)) {
@@ -62,26 +103,35 @@
             $basis->isupload($imgdir);
 
             //没有上传过的图片，继续写入数据库
-            $last_user_id = $database->insert("imginfo", [
+            $database->insert("imginfo", [
                 "path"      =>  $imgdir,
                 "ip"        =>  $ip,
                 "ua"        =>  $ua,
                 "date"      =>  $date,
                 "dir"       =>  $updir,
                 "compress"  =>  0,
-                "level"     =>  0
+                "level"     =>  0,
+                "size"      =>  filesize($new_img)
             ]);
             //返回最后的ID
             $account_id = $database->id();
+            //数据有变化，清除后台统计缓存
+            Cache::bust("stats");
+            //游客上传会影响探索发现页，同步清除本月候选缓存
+            if($updir == $config['userdir']) {
+                Cache::bust("found-".date('Y-m',$now));
+            }
             //上传成功，返回json数据
+            //dispose标记告诉前端是否还需要请求dispose.php（压缩/鉴黄都未开启时不用请求）
             $redata = array(
                 "code"      =>  1,
                 "id"        =>  $account_id,
                 "url"       =>  $imgurl,
                 "width"     =>  $handle->image_dst_x,
-                "height"    =>  $handle->image_dst_y
+                "height"    =>  $handle->image_dst_y,
+                "dispose"   =>  (($tinypng['option'] == true) || ($ModerateContent['option'] == true)) ? 1 : 0
             );
-            echo $redata = json_encode($redata);
+            echo json_encode($redata,JSON_UNESCAPED_UNICODE|JSON_UNESCAPED_SLASHES);
             $handle->clean();
         } else {
             //上传出现错误，返回报错信息
@@ -89,7 +139,7 @@
                 "code"  =>  0,
                 "msg"   =>  $handle->error
             );
-            echo json_encode($redata);
+            echo json_encode($redata,JSON_UNESCAPED_UNICODE|JSON_UNESCAPED_SLASHES);
         }
     }
 ?>
\ No newline at end of file
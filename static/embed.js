@@ -36,25 +36,27 @@ layui.use(['layer', 'form','element','upload','flow'], function(){
             }
             else if(res.code == 1){
                 layer.closeAll('loading'); 
-                $("#showpic a").attr('href',res.url);
-                $("#showpic img").attr('src',res.url);
-                $("#url").val(res.url);
-                $("#html").val("<img src = '" + res.url + "' />");
-                $("#markdown").val("![](" + res.url + ")");
-                $("#bbcode").val("[img]" + res.url + "[/img]");
-                $("#upok").show();
-                //请求接口处理图片
-                $.get("./dispose.php?id="+res.id,function(data,status){
-                    var obj = eval('(' + data + ')');
-                    if(obj.level == 3){
-                        layer.open({
-                            title: '温馨提示'
-                            ,content: '请勿上传违规图片！'
-                        }); 
-                    }
-                });
+                showlinks(res.url);
+                //请求接口处理图片（压缩/鉴黄均未开启时后端会返回dispose=0，此时无需请求）
+                if(res.dispose == 1){
+                    $.get("./dispose.php?id="+res.id,function(data,status){
+                        //接口返回的是标准JSON，用原生解析代替eval
+                        var obj = JSON.parse(data);
+                        if(obj.level == 3){
+                            layer.open({
+                                title: '温馨提示'
+                                ,content: '请勿上传违规图片！'
+                            });
+                        }
+                    });
+                }
             }
         }
+        //请求失败时关闭loading，避免上传出错后一直转圈
+        ,error: function(){
+            layer.closeAll('loading');
+            layer.msg('上传失败，请重试！', {time: 2000});
+        }
     });
     //上传到sm.ms
     upload.render({
@@ -74,22 +76,45 @@ layui.use(['layer', 'form','element','upload','flow'], function(){
             }
             else if(res.code == 'success'){
                 layer.closeAll('loading'); 
-                $("#showpic a").attr('href',res.data.url);
-                $("#showpic img").attr('src',res.data.url);
-                $("#url").val(res.data.url);
-                $("#html").val("<img src = '" + res.data.url + "' />");
-                $("#markdown").val("![](" + res.data.url + ")");
-                $("#bbcode").val("[img]" + res.data.url + "[/img]");
-                $("#upok").show();
+                showlinks(res.data.url);
                 $.post("./functions/sm.php",{data:res.data},function(data,status){
 
                 });
             }
         }
+        //请求失败时关闭loading，避免上传出错后一直转圈
+        ,error: function(){
+            layer.closeAll('loading');
+            layer.msg('上传失败，请重试！', {time: 2000});
+        }
     });
     //上传到sm.ms end
 });
 
+//上传成功后填充预览图和各种格式的链接，两个上传入口共用
+//涉及的元素首次调用时查找一次，之后直接复用引用
+var linkels = null;
+function showlinks(url){
+    if(!linkels){
+        linkels = {
+            pica: $("#showpic a"),
+            picimg: $("#showpic img"),
+            url: $("#url"),
+            html: $("#html"),
+            markdown: $("#markdown"),
+            bbcode: $("#bbcode"),
+            upok: $("#upok")
+        };
+    }
+    linkels.pica.attr('href',url);
+    linkels.picimg.attr('src',url);
+    linkels.url.val(url);
+    linkels.html.val("<img src = '" + url + "' />");
+    linkels.markdown.val("![](" + url + ")");
+    linkels.bbcode.val("[img]" + url + "[/img]");
+    linkels.upok.show();
+}
+
 //复制链接
 function copy(info){
     var copy = new clipBoard(document.getElementById('piclink'), {
@@ -103,11 +128,8 @@ function copy(info){
 
         }
     });
-    layui.use('layer', function(){
-          var layer = layui.layer;
-      
-          layer.msg('复制成功！', {time: 2000})
-    }); 
+    //layer模块已在页面初始化时载入，这里直接使用
+    layer.msg('复制成功！', {time: 2000});
 }
 //后台复制URL
 function copyurl(url){
@@ -122,11 +144,7 @@ function copyurl(url){
 
         }
     });
-    layui.use('layer', function(){
-          var layer = layui.layer;
-      
-          layer.msg('链接已复制！', {time: 2000})
-    }); 
+    layer.msg('链接已复制！', {time: 2000});
 }
 
 //用户登录方法
@@ -143,87 +161,62 @@ function login(){
 //用户前台预览图片
 function userpreview(imgurl,id){
     var showimg = "<center><img style = 'max-width:100%;max-height:100%;' src = '" + imgurl + "' /></center>";
-    layui.use('layer', function(){
-        var layer = layui.layer;
-        layer.open({
-            type: 1,
-            title:"图片预览",
-            area: ['80%', '80%'],
-            content: showimg
-      });
-  }); 
+    layer.open({
+        type: 1,
+        title:"图片预览",
+        area: ['80%', '80%'],
+        content: showimg
+    });
 }
 
 //后台管理员查看图片
 function adminshow(imgurl,id){
     var showimg = "<center><img style = 'max-width:100%;max-height:100%;' src = '" + imgurl + "' /></center>";
-    layui.use('layer', function(){
-        var layer = layui.layer;
-        layer.open({
-            type: 1,
-            title:"图片预览",
-            area: ['80%', '80%'],
-            content: showimg,
-            btn: ['压缩', '删除'],
-            yes: function(index, layero){
-                layer.msg('该功能还在开发中！', {time: 2000})
-            }
-            //删除按钮
-            ,btn2: function(index, layero){
-                layer.confirm('确认删除？', {icon: 3, title:'温馨提示！'}, function(index){
-                    $.get("./delete.php?id="+id,function(data,status){
-                        if(data == 'ok') {
-                            $("#imgid"+id).remove();
-                        }
-                        else{
-                            alert(data);
-                        }
-                    });
-                
-                layer.close(index);
-                });
-            }
-      });
-  }); 
+    layer.open({
+        type: 1,
+        title:"图片预览",
+        area: ['80%', '80%'],
+        content: showimg,
+        btn: ['压缩', '删除'],
+        yes: function(index, layero){
+            layer.msg('该功能还在开发中！', {time: 2000})
+        }
+        //删除按钮
+        ,btn2: function(index, layero){
+            adminconfirm('del',id);
+        }
+    });
 }
 
 //后台管理员查看SM.MS图片
 function smshow(imgurl,id){
     var showimg = "<center><img style = 'max-width:100%;max-height:100%;' src = '" + imgurl + "' /></center>";
-    layui.use('layer', function(){
-        var layer = layui.layer;
-        layer.open({
-            type: 1,
-            title:"图片预览",
-            area: ['80%', '80%'],
-            content: showimg,
-            btn: ['压缩', '删除'],
-            yes: function(index, layero){
-                layer.msg('SM.MS图片不支持压缩！', {time: 2000})
-            }
-            //删除按钮
-            ,btn2: function(index, layero){
-                layer.confirm('确认删除？', {icon: 3, title:'温馨提示！'}, function(index){
-                    $.get("./delete.php?type=sm&id="+id,function(data,status){
-                        if(data == 'ok') {
-                            $("#imgid"+id).remove();
-                        }
-                        else{
-                            alert(data);
-                        }
-                    });
-                
-                layer.close(index);
-                });
-            }
-      });
-  }); 
+    layer.open({
+        type: 1,
+        title:"图片预览",
+        area: ['80%', '80%'],
+        content: showimg,
+        btn: ['压缩', '删除'],
+        yes: function(index, layero){
+            layer.msg('SM.MS图片不支持压缩！', {time: 2000})
+        }
+        //删除按钮
+        ,btn2: function(index, layero){
+            adminconfirm('delsm',id);
+        }
+    });
 }
 
-//删除某张图片
-function deleteimg(id){
-    layer.confirm('确认删除？', {icon: 3, title:'温馨提示！'}, function(index){
-        $.get("./delete.php?id="+id,function(data,status){
+//后台确认类操作：action到接口的映射只定义一次，统一走一个入口
+var adminActions = {
+    del:      {url: "./delete.php?id=",                  msg: '确认删除？'},
+    delsm:    {url: "./delete.php?type=sm&id=",          msg: '确认删除？'},
+    cdubious: {url: "./operation.php?type=cdubious&id=", msg: '确认取消图片可疑状态？'}
+};
+function adminconfirm(action,id){
+    var act = adminActions[action];
+    layer.confirm(act.msg, {icon: 3, title:'温馨提示！'}, function(index){
+        $.get(act.url + id,function(data,status){
             if(data == 'ok') {
                 $("#imgid"+id).remove();
             }
@@ -231,40 +224,54 @@ function deleteimg(id){
                 alert(data);
             }
         });
-    
+
     layer.close(index);
     });
 }
-//删除SM.MS图片
-function deletesm(id){
-    layer.confirm('确认删除？', {icon: 3, title:'温馨提示！'}, function(index){
-        $.get("./delete.php?type=sm&id="+id,function(data,status){
+
+//全选/取消全选
+function checkall(box){
+    $(".batchck").prop('checked',box.checked);
+}
+//批量删除选中的图片，多个ID合并成一次请求
+function batchdelete(){
+    var ids = [];
+    $(".batchck:checked").each(function(){
+        ids.push($(this).val());
+    });
+    if(ids.length == 0){
+        layer.msg('请先勾选要删除的图片！', {time: 2000});
+        return;
+    }
+    layer.confirm('确认删除选中的' + ids.length + '张图片？', {icon: 3, title:'温馨提示！'}, function(index){
+        $.get("./delete.php?id=" + ids.join(','),function(data,status){
             if(data == 'ok') {
-                $("#imgid"+id).remove();
+                for(var i = 0; i < ids.length; i++){
+                    $("#imgid" + ids[i]).remove();
+                }
             }
             else{
+                //部分删除失败时提示失败的ID，并刷新列表和数据库保持一致
                 alert(data);
+                location.reload();
             }
         });
-    
-    layer.close(index);
+        layer.close(index);
     });
 }
 
+//删除某张图片
+function deleteimg(id){
+    adminconfirm('del',id);
+}
+//删除SM.MS图片
+function deletesm(id){
+    adminconfirm('delsm',id);
+}
+
 //取消图片可疑状态
 function cdubious(id){
-    layer.confirm('确认取消图片可疑状态？', {icon: 3, title:'温馨提示！'}, function(index){
-        $.get("./operation.php?type=cdubious&id="+id,function(data,status){
-            if(data == 'ok') {
-                $("#imgid"+id).remove();
-            }
-            else{
-                alert(data);
-            }
-        });
-    
-    layer.close(index);
-    });
+    adminconfirm('cdubious',id);
 }
 
 //图片压缩功能
@@ -279,10 +286,20 @@ function compress(id){
     });
 }
 
-//IP查询
+//IP查询，同一个IP的结果记住，重复点击不再请求接口
+var ipcache = {};
 function ipquery(ip){
+    if(ipcache[ip]){
+        layer.open({
+            title: 'IP查询结果：'
+            ,content: ipcache[ip]
+            ,time:3000
+        });
+        return;
+    }
     $.get("https://ip.awk.sh/api.php?data=addr&ip=" + ip,function(data,status){
         if(status == 'success') {
+            ipcache[ip] = data;
             layer.open({
                 title: 'IP查询结果：'
                 ,content: data
@@ -4,7 +4,7 @@
 		<div class = "layui-container">
 			<div class = "layui-row">
 				<div class = "layui-col-lg12">
-				Copyright © 2017-2018 Powered by <a href="https://imgurl.org/" target = "_blank">ImgURL</a>. | Author <a href="https://www.xiaoz.me/" target = "_blank">xiaoz.me</a>
+				Copyright © 2017-<?php echo date('Y',$_SERVER['REQUEST_TIME']); ?> Powered by <a href="https://imgurl.org/" target = "_blank">ImgURL</a>. | Author <a href="https://www.xiaoz.me/" target = "_blank">xiaoz.me</a>
 				</div>
 			</div>
 		</div>
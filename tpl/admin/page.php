@@ -0,0 +1,16 @@
+<?php
+    //翻页按钮，三个列表页共用，页码在这里统一计算
+    $up = (int)$page - 1;
+    if($up <= 0){
+        $up = 1;
+    }
+    $down = (int)$page + 1;
+?>
+<!-- 翻页按钮 -->
+<div class="layui-col-lg9 layui-col-md-offset3">
+    <div class="page">
+        <a href="?type=<?php echo $type; ?>&page=<?php echo $up; ?>" class="layui-btn">上一页</a>
+        <a href="?type=<?php echo $type; ?>&page=<?php echo $down; ?>" class="layui-btn">下一页</a>
+    </div>
+</div>
+<!-- 翻页按钮END -->
@@ -2,7 +2,7 @@
 	/*
 	未经作者同意，请勿去掉版权。若有疑问请联系QQ:337003006
 	*/
-	$year = date('Y',time());
+	$year = date('Y',$_SERVER['REQUEST_TIME']);
  ?>
  <div style = "clear:both;"></div>
  <!-- 底部 -->
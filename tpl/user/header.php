@@ -1,4 +1,10 @@
-<?php error_reporting(E_ALL^E_NOTICE^E_WARNING^E_DEPRECATED); ?>
+<?php
+    error_reporting(E_ALL^E_NOTICE^E_WARNING^E_DEPRECATED);  //部分前台页面不载入config.php，这里兜底
+    //开启gzip压缩，减小页面传输体积（客户端不支持时自动跳过）
+    if(!ob_get_level() && extension_loaded('zlib')) {
+        ob_start('ob_gzhandler');
+    }
+?>
 <!DOCTYPE html>
 <html lang="zh-cmn-Hans" xmlns="http://www.w3.org/1999/xhtml">
 <head>
@@ -9,11 +15,16 @@
 	<meta name="keywords" content="ImgURL,免费图床,图床程序,小z图床,XZ Pic" />
     <meta name="description" content="ImgURL是一个简单、纯粹的图床程序，让个人图床多一个选择。" />
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <!-- 提前与外部资源域名建连，首个请求不用再等DNS和握手 -->
+    <link rel="dns-prefetch" href="//cdn.bootcss.com">
+    <link rel="preconnect" href="https://cdn.bootcss.com" crossorigin>
+    <link rel="dns-prefetch" href="//libs.xiaoz.top">
+    <link rel="preconnect" href="https://libs.xiaoz.top" crossorigin>
     <link rel="shortcut icon" href="favicon.ico"  type="image/x-icon" />
 	<link rel="Bookmark" href="favicon.ico" />
     <link rel="stylesheet" href="./static/layui/css/layui.css">
     <link rel="stylesheet" href="./static/style.css?v=1.10506">
-    <script src = "https://libs.xiaoz.top/clipBoard.js/clipBoard.min.js"></script>
+    <script defer src = "https://libs.xiaoz.top/clipBoard.js/clipBoard.min.js"></script>
 </head>
 <body>
     <!-- 顶部导航栏 -->
@@ -0,0 +1,40 @@
+<!-- 上传成功后的预览和链接面板，首页和SM.MS页共用 -->
+<div style = "clear:both;"></div>
+<!-- 图片上传成功 -->
+<div class="layui-row" id = "upok"> 
+    <div>
+        <div id="showpic" class = "layui-col-lg5"><a href="" target = "_blank"><img src=""></a></div>
+        <div id="piclink" class = "layui-col-lg6 layui-col-md-offset1">
+        <table class="layui-table" lay-skin="nob">
+            <colgroup>
+                <col width="80">
+                <col width="400">
+                <col>
+            </colgroup>
+            <tbody>
+                <tr>
+                    <td>URL</td>
+                    <td><input type="text" class="layui-input" id = "url"></td>
+                    <td><a href="javascript:;" class = "layui-btn layui-btn-sm" onclick = "copy('url')">复制</a></td>
+                </tr>
+                <tr>
+                    <td>HTML</td>
+                    <td><input type="text" class="layui-input" id = "html"></td>
+                    <td><a href="javascript:;" class = "layui-btn layui-btn-sm" onclick = "copy('html')">复制</a></td>
+                </tr>
+                <tr>
+                    <td>MarkDown</td>
+                    <td><input type="text" class="layui-input" id = "markdown"></td>
+                    <td><a href="javascript:;" class = "layui-btn layui-btn-sm" onclick = "copy('markdown')">复制</a></td>
+                </tr>
+                <tr>
+                    <td>BBcode</td>
+                    <td><input type="text" class="layui-input" id = "bbcode"></td>
+                    <td><a href="javascript:;" class = "layui-btn layui-btn-sm" onclick = "copy('bbcode')">复制</a></td>
+                </tr>
+            </tbody>
+        </table>
+        </div>
+    </div>       
+</div>
+<!-- 图片上传成功END -->
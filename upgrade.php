@@ -10,12 +10,12 @@
 		exit;
 	}
 
-	//判断版本号
-	switch ( $v )
-	{
-		case "1.1":
+	//各版本的升级内容按版本号顺序排列，check用于判断该步骤是否已经执行过
+	$upgrades = array(
+		"1.1"	=>	array(
 			//增加表
-			$sql = 'CREATE TABLE "main"."sm" (
+			"check"	=>	array("table","sm"),
+			"sql"	=>	'CREATE TABLE "main"."sm" (
 "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
 "ip" TEXT NOT NULL,
 "ua" TEXT NOT NULL,
@@ -24,17 +24,61 @@
 "delete" TEXT NOT NULL,
 CONSTRAINT "delete" UNIQUE ("delete")
 )
-;';			$data = $database->query($sql);
-			if($data) {
-				echo '数据表创建成功！';
-			}
-			else{
-				echo '数据表创建失败，可能是数据库不可写或已经升级过！';
+;',
+			"msg"	=>	'数据表创建成功！'
+		),
+		"1.2"	=>	array(
+			//为imginfo增加索引，加快探索发现和后台列表的查询
+			"check"	=>	array("index","idx_imginfo_dir_level_date"),
+			"sql"	=>	'CREATE INDEX IF NOT EXISTS "idx_imginfo_dir_level_date" ON "imginfo" ("dir","level","date");',
+			"msg"	=>	'索引创建成功！'
+		),
+		"1.3"	=>	array(
+			//imginfo增加size字段，上传时记录文件大小，后台列表不再逐个读取文件
+			"check"	=>	array("column","size"),
+			"sql"	=>	'ALTER TABLE "imginfo" ADD COLUMN "size" INTEGER NOT NULL DEFAULT 0;',
+			"msg"	=>	'字段添加成功！'
+		)
+	);
+
+	//判断某个升级步骤是否已经执行过，已执行的直接跳过，不再重复发语句
+	function upgraded($database,$check){
+		if($check[0] == 'column') {
+			$columns = $database->query("PRAGMA table_info(`imginfo`)")->fetchAll();
+			foreach($columns as $column) {
+				if($column['name'] == $check[1]) {
+					return true;
+				}
 			}
-			break;		
-		default:
-			echo '未知的版本号！';
-			exit;
-			break;
+			return false;
+		}
+		$num = $database->query("SELECT COUNT(*) AS `num` FROM `sqlite_master` WHERE `type` = '".$check[0]."' AND `name` = '".$check[1]."'")->fetch();
+		return $num['num'] > 0;
+	}
+
+	//v=all时按顺序应用全部未执行的升级，只需访问一次
+	if($v == 'all') {
+		$targets = $upgrades;
+	}
+	elseif(isset($upgrades[$v])) {
+		$targets = array($v => $upgrades[$v]);
+	}
+	else{
+		echo '未知的版本号！';
+		exit;
+	}
+
+	foreach($targets as $version => $upgrade) {
+		if(upgraded($database,$upgrade['check'])) {
+			echo 'v'.$version.'：已经升级过，无需重复执行！<br />';
+			continue;
+		}
+		$data = $database->query($upgrade['sql']);
+		if($data) {
+			echo 'v'.$version.'：'.$upgrade['msg'].'<br />';
+		}
+		else{
+			echo 'v'.$version.'：升级失败，可能是数据库不可写！<br />';
+		}
 	}
-?>
\ No newline at end of file
+?>